@@ -1,13 +1,161 @@
 #!/usr/bin/env python3
 import os
 import json
+import mmap
 import re
 import sys
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+import threading
+import zlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, unquote_plus
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
+from functools import lru_cache
 import argparse
 
+# Optional accelerator: hyperscan compiles patterns to a DFA and scans
+# in vectorized C with guaranteed linear time, which also neutralises
+# catastrophic backtracking on user-supplied patterns. The server works
+# fine without it.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Regex metacharacters; a filter containing none of these is a plain
+# literal and can use a C-level substring scan instead of the regex VM
+_META = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+# Rough estimate used to size the single-read fast path for small tails
+_AVG_LINE_BYTES = 200
+
+# Bound once; skips the module attribute lookup on every filter build
+_IGNORECASE = re.IGNORECASE
+
+# Filtered scans of files at least this large may fan out across CPU
+# cores - but only after a sequential scan of the newest
+# _SEQ_SCAN_BYTES has failed to fill the request, so dense filters
+# (which find their lines within the tail) never pay for a full read
+_PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+_SEQ_SCAN_BYTES = 4 * 1024 * 1024
+
+# Worker count for parallel filtered scans; the pool itself is created
+# lazily and shared across requests so each scan skips process startup
+_POOL_WORKERS = min(os.cpu_count() or 1, 8)
+_FILTER_POOL = None
+_FILTER_POOL_LOCK = threading.Lock()
+
+def _filter_pool():
+    """Return the shared filter worker pool, creating it on first use"""
+    global _FILTER_POOL
+    if _FILTER_POOL is None:
+        with _FILTER_POOL_LOCK:
+            if _FILTER_POOL is None:
+                _FILTER_POOL = ProcessPoolExecutor(max_workers=_POOL_WORKERS)
+    return _FILTER_POOL
+
+@lru_cache(maxsize=256)
+def _compile_filter(pattern, flags: int):
+    """Compile and cache a filter pattern.
+
+    The module-level LRU cache means repeated requests with the same
+    filter (dashboards, polling clients) skip recompilation entirely.
+    """
+    return re.compile(pattern, flags)
+
+@lru_cache(maxsize=128)
+def _compile_hyperscan(pattern: bytes):
+    """Compile and cache a hyperscan database for one pattern"""
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    db.compile(expressions=[pattern], flags=[hyperscan.HS_FLAG_CASELESS])
+    return db
+
+def _build_filter(filter_text: Optional[str]):
+    """Build a bytes-level keep(line) predicate for filter_text.
+
+    Returns None when no filtering is needed so callers can take the
+    unfiltered bulk path. Plain literals (the common case: "ERROR",
+    "WARN") use a substring scan; anything with regex metacharacters
+    goes through hyperscan when available (linear-time DFA, immune to
+    catastrophic backtracking on URL-supplied patterns) and otherwise
+    through the cached compiled re pattern.
+
+    Raises:
+        ValueError: If filter_text is not a valid pattern
+    """
+    if not filter_text:
+        return None
+
+    # Anchored literals ("^ERROR", "timeout$", "^exact$") are common
+    # operator shorthand; startswith/endswith are C-level string ops,
+    # far cheaper per line than the regex engine
+    anchored_start = filter_text.startswith('^')
+    anchored_end = filter_text.endswith('$') and not filter_text.endswith('\\$')
+    body = filter_text[1 if anchored_start else 0:
+                       -1 if anchored_end else None]
+    if (anchored_start or anchored_end) and not _META.search(body):
+        literal = body.lower().encode('utf-8')
+        if anchored_start and anchored_end:
+            return lambda raw: raw.lower() == literal
+        if anchored_start:
+            return lambda raw: raw.lower().startswith(literal)
+        return lambda raw: raw.lower().endswith(literal)
+
+    if _META.search(filter_text):
+        encoded = filter_text.encode('utf-8')
+        if hyperscan is not None:
+            try:
+                db = _compile_hyperscan(encoded)
+            except hyperscan.error:
+                raise ValueError(f"Invalid filter pattern: {filter_text}") from None
+
+            def keep(raw):
+                hits = []
+                db.scan(raw, match_event_handler=lambda *args: hits.append(True))
+                return bool(hits)
+            return keep
+        try:
+            pattern = _compile_filter(encoded, _IGNORECASE)
+        except re.error:
+            raise ValueError(f"Invalid filter pattern: {filter_text}") from None
+        return lambda raw: pattern.search(raw) is not None
+    needle = filter_text.lower().encode('utf-8')
+    return lambda raw: needle in raw.lower()
+
+def _decoded(raws):
+    """Decode the byte lines that survived the scan"""
+    return [raw.decode('utf-8', errors='ignore') for raw in raws]
+
+def _filter_range(path, start, end, filter_text, limit):
+    """Worker: return the newest matching raw lines of path[start:end].
+
+    Runs in a separate process, so the filter predicate is rebuilt here
+    rather than pickled. start and end must sit on line boundaries. At
+    most limit lines come back, so a dense filter cannot balloon the
+    result pickled to the parent.
+    """
+    keep = _build_filter(filter_text)
+    with open(path, 'rb') as f:
+        data = os.pread(f.fileno(), end - start, start)
+    kept = deque((raw for raw in data.splitlines() if keep(raw)), maxlen=limit)
+    return list(kept)
+
+def _parse_query(query: str) -> dict:
+    """Parse the small fixed /logs query schema into a flat dict.
+
+    parse_qs allocates a dict of lists on every request even though all
+    our parameters are scalar; a flat first-occurrence-wins dict keeps
+    the old semantics at a fraction of the per-request cost.
+    """
+    params = {}
+    if query:
+        for part in query.split('&'):
+            key, _, value = part.partition('=')
+            if key and key not in params:
+                params[key] = unquote_plus(value)
+    return params
+
 class LogRetrievalServer:
     """
     A minimal, dependency-light log retrieval server for Unix-based systems.
@@ -17,7 +165,10 @@ class LogRetrievalServer:
     - Minimal external dependencies
     - Secure, configurable log access
     """
-    
+
+    # Maximum number of (file identity, query) -> result entries kept
+    RESULT_CACHE_SIZE = 128
+
     def __init__(self, auth_token: Optional[str] = None, max_lines: int = 1000):
         """
         Initialize the log retrieval server.
@@ -29,11 +180,33 @@ class LogRetrievalServer:
         self.log_dir = '/var/log'  # Hard-coded to /var/log
         self.auth_token = auth_token
         self.max_lines = max_lines
-        
+
+        # Cached realpath of log_dir, refreshed lazily if log_dir changes
+        self._log_dir_seen = None
+        self._log_dir_real = None
+
+        # LRU of recent scan results keyed by file identity and query;
+        # an mtime/size change busts the key automatically. Handler
+        # threads share this dict, so the (cheap) lookup and LRU
+        # bookkeeping happen under a lock; scans themselves do not
+        self._result_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
         # Validate log directory
         if not os.path.isdir(self.log_dir):
             raise ValueError(f"Invalid log directory: {self.log_dir}")
-        
+
+    def _resolved_log_dir(self):
+        """Return the realpath of log_dir with a trailing separator.
+
+        Resolved once and cached so the per-request security check
+        avoids repeated getcwd/normpath work.
+        """
+        if self.log_dir != self._log_dir_seen:
+            self._log_dir_seen = self.log_dir
+            self._log_dir_real = os.path.realpath(self.log_dir) + os.sep
+        return self._log_dir_real
+
     def read_log_file(self, filename, lines=None, filter_text=None):
         """
         Read log file with efficient filtering and pagination.
@@ -49,72 +222,374 @@ class LogRetrievalServer:
         """
         full_path = os.path.join(self.log_dir, filename)
 
-        # Security: Prevent directory traversal
-        if not os.path.abspath(full_path).startswith(os.path.abspath(self.log_dir)):
+        # Security: Prevent directory traversal (symlinks included);
+        # the resolved log-dir prefix is cached on the instance
+        if not os.path.realpath(full_path).startswith(self._resolved_log_dir()):
             raise PermissionError(f"Invalid file path: {filename}")
 
-        if not os.path.exists(full_path):
-            raise FileNotFoundError(f"Log file not found: {filename}")
+        # Clamp negative counts to zero: every scan path must keep the
+        # baseline "no lines requested, no lines returned" behaviour
+        # (the reversed-slice fast path would otherwise serve data)
+        lines_wanted = max(lines or self.max_lines, 0)
+
+        # Identical repeat requests against an unchanged file (refresh
+        # buttons, dashboard widgets) are served from the result cache
+        try:
+            st = os.stat(full_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Log file not found: {filename}") from None
+        if not lines_wanted:
+            return []
+        key = ('file', full_path, st.st_mtime_ns, st.st_size,
+               lines_wanted, filter_text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
+
+        result = self._scan_tail(full_path, filename, lines_wanted, filter_text)
+        self._cache_put(key, result)
+        return list(result)
+
+    def _cache_get(self, key):
+        """Look up a cached result, refreshing its LRU position"""
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+            return cached
+
+    def _cache_put(self, key, value):
+        """Store a result, evicting the least recently used entry"""
+        with self._cache_lock:
+            self._result_cache[key] = value
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def stat_log_file(self, filename):
+        """Stat a log file after the usual path security check.
+
+        Lets the HTTP layer build cache validators (ETag) from the
+        file identity without reading any of it.
+        """
+        full_path = os.path.join(self.log_dir, filename)
+
+        if not os.path.realpath(full_path).startswith(self._resolved_log_dir()):
+            raise PermissionError(f"Invalid file path: {filename}")
 
-        lines_wanted = lines or self.max_lines
+        try:
+            return os.stat(full_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Log file not found: {filename}") from None
+
+    def _scan_tail(self, full_path, filename, lines_wanted, filter_text):
+        """Scan backwards from EOF and return the newest matching lines"""
         matching_lines = []
-        
+
+        # Compile the filter once per request (cached across requests)
+        # instead of re-matching the raw string against every line.
+        # Plain literals (the common case: "ERROR", "WARN") skip the
+        # regex engine entirely in favour of a substring scan.
+        # The scan itself works on raw bytes: only lines that survive
+        # the filter are decoded, so decode cost tracks matched bytes
+        # rather than file size
+        keep = _build_filter(filter_text)
+
         try:
             with open(full_path, 'rb') as f:
                 # Start from end of file
-                f.seek(0, os.SEEK_END)
-                pos = f.tell()
-                
+                fd = f.fileno()
+                pos = os.fstat(fd).st_size
+
                 # Read chunks from end of file
-                chunk_size = 8192  # 8KB chunks
-                leftovers = ''
-                
+                chunk_size = 64 * 1024  # 64KB chunks
+                leftovers = b''
+
+                # Fast path: a small tail request usually fits in the
+                # final chunk, so read it once and skip the stitching loop
+                if lines_wanted * _AVG_LINE_BYTES <= chunk_size:
+                    start = max(pos - chunk_size, 0)
+                    chunk_lines = os.pread(fd, pos - start, start).splitlines()
+                    if start > 0 and chunk_lines:
+                        # First line may be partial; the slow path will
+                        # re-read it correctly if we fall through
+                        chunk_lines = chunk_lines[1:]
+                    if keep is None:
+                        # No filter: take the newest lines in one slice
+                        # instead of looping per line in Python
+                        take = min(lines_wanted, len(chunk_lines))
+                        matching_lines.extend(chunk_lines[:-take - 1:-1])
+                    else:
+                        for raw in reversed(chunk_lines):
+                            if keep(raw):
+                                matching_lines.append(raw)
+                                if len(matching_lines) >= lines_wanted:
+                                    break
+                    if len(matching_lines) >= lines_wanted or start == 0:
+                        return _decoded(matching_lines)
+                    # Unusually long lines or a sparse filter: start over
+                    # with the full backwards scan
+                    matching_lines = []
+
+                # Map the whole file and walk backwards with rfind: one
+                # syscall, C-level newline scanning, and none of the
+                # chunk-stitching logic below
+                try:
+                    mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    mm = None  # empty or unmappable file
+
+                if mm is not None:
+                    with mm:
+                        end = len(mm)
+                        if mm[end - 1:end] == b'\n':
+                            end -= 1
+                        if keep is None:
+                            # No filter: step back over lines_wanted
+                            # newlines with rfind (index arithmetic
+                            # only), then split the region once in C
+                            scan_end = end
+                            count = 0
+                            while end > 0 and count < lines_wanted:
+                                end = mm.rfind(b'\n', 0, end)
+                                count += 1
+                            matching_lines = mm[end + 1:scan_end].splitlines()
+                            matching_lines.reverse()
+                        else:
+                            # Dense filters usually fill the quota from
+                            # the newest few megabytes, so scan those
+                            # sequentially first; only a huge file whose
+                            # tail came up short fans the rest of the
+                            # scan out across worker processes
+                            huge = len(mm) >= _PARALLEL_MIN_BYTES
+                            floor = end - _SEQ_SCAN_BYTES if huge else 0
+                            while end > floor and len(matching_lines) < lines_wanted:
+                                nl = mm.rfind(b'\n', 0, end)
+                                raw = mm[nl + 1:end]
+                                if keep(raw):
+                                    matching_lines.append(raw)
+                                end = nl
+                            if huge and end > 0 and len(matching_lines) < lines_wanted:
+                                matching_lines.extend(self._parallel_filter(
+                                    full_path, mm, end + 1,
+                                    lines_wanted - len(matching_lines),
+                                    filter_text))
+                    return _decoded(matching_lines)
+
                 while pos > 0 and len(matching_lines) < lines_wanted:
-                    # Move back by chunk size
+                    # Move back by chunk size; pread reads at an explicit
+                    # offset, one syscall per chunk instead of seek+read
                     chunk_end = pos
                     pos = max(pos - chunk_size, 0)
-                    f.seek(pos)
-                    
-                    # Read chunk and decode
-                    chunk = f.read(chunk_end - pos)
-                    text = chunk.decode('utf-8', errors='ignore')
-                    
-                    # Split into lines and handle partial lines
-                    chunk_lines = text.splitlines()
-                    
-                    if leftovers:
-                        chunk_lines[-1] = chunk_lines[-1] + leftovers
+                    chunk = os.pread(fd, chunk_end - pos, pos)
+
+                    # Stitch the partial line carried over from the
+                    # previous (later) chunk, peel off the partial line
+                    # at the front of this one, and split the rest.
+                    # Cutting at the first newline avoids rebuilding the
+                    # line list just to drop its head, and a chunk with
+                    # no newline at all simply grows the carry-over.
+                    buf = chunk + leftovers if leftovers else chunk
                     if pos > 0:
-                        leftovers = chunk_lines[0]
-                        chunk_lines = chunk_lines[1:]
-                    
-                    # Process lines in reverse
-                    for line in reversed(chunk_lines):
-                        if filter_text and filter_text not in line:
+                        cut = buf.find(b'\n')
+                        if cut == -1:
+                            leftovers = buf
                             continue
-                        matching_lines.append(line)
-                        if len(matching_lines) >= lines_wanted:
-                            break
+                        leftovers = buf[:cut]
+                        buf = buf[cut + 1:]
+                    chunk_lines = buf.splitlines()
 
-            return matching_lines
+                    # Process lines in reverse
+                    if keep is None:
+                        # No filter: bulk reversed slice, no per-line loop
+                        take = min(lines_wanted - len(matching_lines),
+                                   len(chunk_lines))
+                        matching_lines.extend(chunk_lines[:-take - 1:-1])
+                    else:
+                        for raw in reversed(chunk_lines):
+                            if not keep(raw):
+                                continue
+                            matching_lines.append(raw)
+                            if len(matching_lines) >= lines_wanted:
+                                break
+
+            return _decoded(matching_lines)
 
+        except FileNotFoundError:
+            # Opening the file is the existence check; a separate
+            # os.path.exists would just add a stat and a TOCTOU window
+            raise FileNotFoundError(f"Log file not found: {filename}") from None
         except Exception as e:
             print(f"Error reading log file: {e}")
             raise
 
+    def _parallel_filter(self, full_path, mm, region_end, lines_wanted, filter_text):
+        """Filter mm[:region_end] across CPU cores.
+
+        The region is cut into newline-aligned byte ranges, one per
+        worker in the shared pool; every worker returns at most its
+        newest lines_wanted matches and the ordered results are merged
+        so the newest lines win. Memory is bounded by
+        workers * lines_wanted lines regardless of match density.
+        """
+        pool = _filter_pool()
+
+        # Range boundaries snapped forward to the next line start
+        bounds = [0]
+        for i in range(1, _POOL_WORKERS):
+            nl = mm.find(b'\n', region_end * i // _POOL_WORKERS)
+            boundary = nl + 1 if nl != -1 else region_end
+            if region_end > boundary > bounds[-1]:
+                bounds.append(boundary)
+        bounds.append(region_end)
+
+        futures = [
+            pool.submit(_filter_range, full_path,
+                        bounds[i], bounds[i + 1], filter_text, lines_wanted)
+            for i in range(len(bounds) - 1)
+        ]
+        matches = []
+        for future in futures:
+            matches.extend(future.result())
+
+        # Keep only the newest matches, newest first
+        matches = matches[-lines_wanted:]
+        matches.reverse()
+        return matches
+
+    def read_log_page(self, filename, lines=None, filter_text=None, cursor=None):
+        """
+        Read one page of log entries, scanning backwards from a cursor.
+
+        Repeated polls with no cursor rescan the whole tail every time;
+        passing the next_cursor from the previous response resumes the
+        scan where it stopped, so paging through a large file costs
+        O(delta) per request instead of O(tail). A next_cursor of 0
+        means the whole file has been scanned.
+
+        Args:
+            filename (str): Log file name
+            lines (int, optional): Number of lines to return
+            filter_text (str, optional): Text to filter log entries
+            cursor (int, optional): Byte offset to scan backwards from
+
+        Returns:
+            dict: 'entries', 'next_cursor' and 'file_size'
+        """
+        full_path = os.path.join(self.log_dir, filename)
+
+        if not os.path.realpath(full_path).startswith(self._resolved_log_dir()):
+            raise PermissionError(f"Invalid file path: {filename}")
+
+        # Same clamp as read_log_file: negative counts return nothing
+        lines_wanted = max(lines or self.max_lines, 0)
+
+        try:
+            st = os.stat(full_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Log file not found: {filename}") from None
+        if not lines_wanted:
+            return {'entries': [], 'next_cursor': 0, 'file_size': st.st_size}
+        key = ('page', full_path, st.st_mtime_ns, st.st_size,
+               lines_wanted, filter_text, cursor)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return dict(cached, entries=list(cached['entries']))
+
+        keep = _build_filter(filter_text)
+        matching_lines = []
+
+        try:
+            with open(full_path, 'rb') as f:
+                fd = f.fileno()
+                size = os.fstat(fd).st_size
+                end = size if cursor is None else max(0, min(cursor, size))
+
+                # Cursor 0 is the done sentinel; stay terminal instead
+                # of letting the scan resurrect a nonzero next_cursor
+                if end == 0:
+                    return {'entries': [], 'next_cursor': 0, 'file_size': size}
+
+                try:
+                    mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # Empty or unmappable file: nothing to page through
+                    return {'entries': [], 'next_cursor': 0, 'file_size': size}
+
+                with mm:
+                    if mm[end - 1:end] == b'\n':
+                        end -= 1
+                    if keep is None:
+                        # Same bulk split as read_log_file: rfind back
+                        # over the wanted newlines, one splitlines call
+                        scan_end = end
+                        count = 0
+                        while end > 0 and count < lines_wanted:
+                            end = mm.rfind(b'\n', 0, end)
+                            count += 1
+                        matching_lines = mm[end + 1:scan_end].splitlines()
+                        matching_lines.reverse()
+                        if end == 0 and count < lines_wanted:
+                            # A newline at offset 0 means the file opens
+                            # with an empty line; emit it and mark the
+                            # scan exhausted so next_cursor reaches 0
+                            matching_lines.append(b'')
+                            end = -1
+                    else:
+                        while end > 0 and len(matching_lines) < lines_wanted:
+                            nl = mm.rfind(b'\n', 0, end)
+                            raw = mm[nl + 1:end]
+                            if keep(raw):
+                                matching_lines.append(raw)
+                            end = nl
+                        if end == 0 and len(matching_lines) < lines_wanted:
+                            # Consume the empty first line (see above)
+                            if keep(b''):
+                                matching_lines.append(b'')
+                            end = -1
+
+                page = {
+                    'entries': _decoded(matching_lines),
+                    'next_cursor': max(end + 1, 0),
+                    'file_size': size,
+                }
+                self._cache_put(key, page)
+                return dict(page, entries=list(page['entries']))
+
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Log file not found: {filename}") from None
+
 class LogRequestHandler(BaseHTTPRequestHandler):
     """
     Custom HTTP Request Handler for Log Retrieval
     """
-    
+
+    # HTTP/1.1 keeps the connection open between requests, sparing
+    # polling clients a TCP handshake per poll. Every response must
+    # then carry a Content-Length or use chunked transfer encoding,
+    # and idle connections are dropped after a read timeout so they
+    # cannot pin a handler thread forever.
+    protocol_version = "HTTP/1.1"
+    timeout = 60
+
     def send_error_json(self, code: int, message: str):
         """Send an error response in JSON format"""
+        body = json.dumps({
+            "error": message
+        }).encode()
         self.send_response(code)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps({
-            "error": message
-        }).encode())
+        self.wfile.write(body)
+
+    def _write_chunk(self, data: bytes):
+        """Write one chunk in HTTP chunked transfer encoding"""
+        if data:
+            self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+
+    def _end_chunks(self):
+        """Terminate a chunked response"""
+        self.wfile.write(b"0\r\n\r\n")
 
     def do_GET(self):
         """Handle GET requests for log retrieval and web UI"""
@@ -127,7 +602,7 @@ class LogRequestHandler(BaseHTTPRequestHandler):
             
         # Handle API requests
         elif parsed_path.path == '/logs':
-            params = parse_qs(parsed_path.query)
+            params = _parse_query(parsed_path.query)
             
             try:
                 # Authentication check
@@ -142,40 +617,113 @@ class LogRequestHandler(BaseHTTPRequestHandler):
                         return
 
                 # Extract query parameters
-                filename = params.get('filename', [None])[0]
+                filename = params.get('filename')
                 if not filename:
                     self.send_error_json(400, "Filename is required")
                     return
                 
                 try:
-                    lines = int(params.get('lines', ['1000'])[0])
+                    lines = int(params.get('lines', '1000'))
                 except ValueError:
                     self.send_error_json(400, "Invalid lines parameter")
                     return
                     
-                filter_text = params.get('filter', [None])[0]
-                
+                filter_text = params.get('filter')
+
+                cursor = params.get('cursor')
+                if cursor is not None:
+                    try:
+                        cursor = int(cursor)
+                    except ValueError:
+                        self.send_error_json(400, "Invalid cursor parameter")
+                        return
+
+                # Conditional GET: a poller whose log hasn't changed gets
+                # a bodyless 304 for the price of a single stat
+                etag = None
+                try:
+                    st = self.server.log_retriever.stat_log_file(filename)
+                    etag = f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+                except (FileNotFoundError, PermissionError):
+                    pass  # the read below reports the real error
+                if etag is not None and self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
                 try:
-                    log_entries = self.server.log_retriever.read_log_file(
-                        filename, 
-                        lines=lines, 
-                        filter_text=filter_text
+                    page = self.server.log_retriever.read_log_page(
+                        filename,
+                        lines=lines,
+                        filter_text=filter_text,
+                        cursor=cursor
                     )
-                    
+                    log_entries = page['entries']
+
+                    # Log text is highly repetitive; gzip at the fastest
+                    # level cuts the payload roughly 10x for clients
+                    # that advertise support
+                    use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+
+                    # Clients that accept NDJSON get one JSON string per
+                    # line with no surrounding array, so they can parse
+                    # and render entries as they arrive
+                    use_ndjson = 'application/x-ndjson' in self.headers.get('Accept', '')
+
                     self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
+                    self.send_header('Content-type',
+                                     'application/x-ndjson' if use_ndjson
+                                     else 'application/json')
+                    if use_gzip:
+                        self.send_header('Content-Encoding', 'gzip')
+                    if etag is not None:
+                        self.send_header('ETag', etag)
+                    self.send_header('Transfer-Encoding', 'chunked')
                     self.end_headers()
-                    
-                    self.wfile.write(json.dumps({
-                        'filename': filename,
-                        'total_entries': len(log_entries),
-                        'entries': log_entries
-                    }).encode())
-                    
+
+                    # Stream the JSON body instead of building one giant
+                    # string; bytes hit the socket as entries are encoded
+                    # and peak memory stays proportional to one line.
+                    # Output is buffered into ~8KB transfer chunks
+                    # (compressed when the client accepts gzip).
+                    comp = zlib.compressobj(1, zlib.DEFLATED, 31) if use_gzip else None
+                    out = bytearray()
+
+                    def w(data):
+                        if comp is not None:
+                            data = comp.compress(data)
+                        out.extend(data)
+                        if len(out) >= 8192:
+                            self._write_chunk(bytes(out))
+                            out.clear()
+
+                    if use_ndjson:
+                        for entry in log_entries:
+                            w(json.dumps(entry).encode() + b'\n')
+                    else:
+                        w(b'{"filename":' + json.dumps(filename).encode())
+                        w(b',"total_entries":' + str(len(log_entries)).encode())
+                        w(b',"next_cursor":' + str(page['next_cursor']).encode())
+                        w(b',"file_size":' + str(page['file_size']).encode())
+                        w(b',"entries":[')
+                        for i, entry in enumerate(log_entries):
+                            if i:
+                                w(b',')
+                            w(json.dumps(entry).encode())
+                        w(b']}')
+                    if comp is not None:
+                        out.extend(comp.flush())
+                    self._write_chunk(bytes(out))
+                    self._end_chunks()
+
                 except FileNotFoundError:
                     self.send_error_json(404, f"Log file not found: {filename}")
                 except PermissionError:
                     self.send_error_json(403, "Access to file path denied")
+                except ValueError as e:
+                    # Bad filter pattern supplied by the client
+                    self.send_error_json(400, str(e))
                 except Exception as e:
                     self.send_error_json(500, f"Internal server error: {str(e)}")
                     
@@ -193,12 +741,13 @@ class LogRequestHandler(BaseHTTPRequestHandler):
             'index.html'
         )
         try:
-            with open(template_path, 'r') as f:
-                html = f.read()
+            with open(template_path, 'rb') as f:
+                body = f.read()
                 self.send_response(200)
                 self.send_header('Content-type', 'text/html')
+                self.send_header('Content-Length', str(len(body)))
                 self.end_headers()
-                self.wfile.write(html.encode())
+                self.wfile.write(body)
         except Exception as e:
             self.send_error_json(500, f"Error serving UI: {str(e)}")
 
@@ -214,12 +763,14 @@ def create_server(
         auth_token (str, optional): Authentication token
     
     Returns:
-        HTTPServer: Configured HTTP server instance
+        ThreadingHTTPServer: Configured HTTP server instance
     """
     log_retriever = LogRetrievalServer(auth_token=auth_token)
     
     server_address = ('', port)
-    httpd = HTTPServer(server_address, LogRequestHandler)
+    # ThreadingHTTPServer handles each request on its own thread, so one
+    # slow scan of a large log no longer stalls every other client
+    httpd = ThreadingHTTPServer(server_address, LogRequestHandler)
     httpd.log_retriever = log_retriever
     httpd.auth_token = auth_token
     